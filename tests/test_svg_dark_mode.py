@@ -1,7 +1,13 @@
 import unittest
 import os
 import shutil
-from svg_dark_mode import add_dark_mode_attributes, process_svg_file, process_folder
+import tempfile
+import zipfile
+import svg_dark_mode
+from svg_dark_mode import (
+    add_dark_mode_attributes, add_dark_mode_attributes_xml, process_svg_file,
+    process_folder, MMAP_MIN_SIZE
+)
 
 class TestSVGDarkMode(unittest.TestCase):
     @classmethod
@@ -121,6 +127,123 @@ class TestSVGDarkMode(unittest.TestCase):
                 )
                 print(f"✓ {filename}: Dark mode attributes verified")
 
+    def test_incremental_skips_unchanged_output(self):
+        """Test that incremental processing does not rewrite unchanged outputs."""
+        source_files = [f for f in os.listdir(self.source_dir) if f.endswith('.svg')]
+        if not source_files:
+            self.skipTest("No SVG files found in original_icons directory")
+        
+        source_file = os.path.join(self.source_dir, source_files[0])
+        output_file = os.path.join(self.output_dir, source_files[0])
+        
+        self.assertTrue(process_svg_file(source_file, output_file))
+        os.utime(output_file, (0, 0))
+        
+        # Matching output leaves the existing file untouched
+        self.assertFalse(process_svg_file(source_file, output_file, skip_unchanged=True))
+        self.assertEqual(os.path.getmtime(output_file), 0)
+        process_folder(self.source_dir, self.output_dir, incremental=True)
+        self.assertEqual(os.path.getmtime(output_file), 0)
+        
+        # Plain runs always rewrite
+        self.assertTrue(process_svg_file(source_file, output_file))
+        self.assertNotEqual(os.path.getmtime(output_file), 0)
+
+    def test_incremental_after_plain_run_and_manual_edit(self):
+        """Test that incremental runs rewrite outputs changed since the manifest."""
+        with tempfile.TemporaryDirectory() as source_dir:
+            source_file = os.path.join(source_dir, 'icon.svg')
+            output_file = os.path.join(self.output_dir, 'icon.svg')
+            
+            def run(fill, incremental):
+                with open(source_file, 'w', encoding='utf-8') as f:
+                    f.write(f'<svg><path fill="{fill}"/></svg>')
+                process_folder(source_dir, self.output_dir, incremental=incremental)
+                with open(output_file, 'r', encoding='utf-8') as f:
+                    return f.read()
+            
+            run('#000000', incremental=True)
+            self.assertIn('fill="#123456"', run('#123456', incremental=False))
+            self.assertIn('fill="#000000" fill-dark="#ffffff"', run('#000000', incremental=True))
+            
+            # Hand edits to an output are overwritten as well
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write('edited')
+            self.assertIn('fill="#000000" fill-dark="#ffffff"', run('#000000', incremental=True))
+
+    def test_process_large_svg_file(self):
+        """Test processing of files large enough to be memory mapped."""
+        paths = '<path fill="#123456" d="M0 0h24v24H0z"/><path fill="black"/>'
+        svg = '<svg>' + paths * (MMAP_MIN_SIZE // len(paths) + 1) + '</svg>'
+        with tempfile.TemporaryDirectory() as source_dir:
+            source_file = os.path.join(source_dir, 'large.svg')
+            output_file = os.path.join(self.output_dir, 'large.svg')
+            with open(source_file, 'w', encoding='utf-8') as f:
+                f.write(svg)
+            self.assertGreaterEqual(os.path.getsize(source_file), MMAP_MIN_SIZE)
+            
+            process_svg_file(source_file, output_file)
+            with open(output_file, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), add_dark_mode_attributes(svg))
+            
+            # Invalid UTF-8 is still reported
+            with open(source_file, 'wb') as f:
+                f.write(svg.encode('utf-8') + b'\xff')
+            with self.assertRaises(UnicodeDecodeError):
+                process_svg_file(source_file, output_file)
+
+    def test_process_folder_parallel(self):
+        """Test that parallel and in-process folder processing agree."""
+        source_files = [f for f in os.listdir(self.source_dir) if f.endswith('.svg')]
+        if not source_files:
+            self.skipTest("No SVG files found in original_icons directory")
+        
+        outputs = []
+        for workers in (1, 2):
+            process_folder(self.source_dir, self.output_dir, workers=workers)
+            contents = {}
+            for filename in source_files:
+                with open(os.path.join(self.output_dir, filename), 'r', encoding='utf-8') as f:
+                    contents[filename] = f.read()
+            outputs.append(contents)
+            self._clean_output_dir()
+        
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_process_folder_archive(self):
+        """Test writing all processed files into a single zip archive."""
+        source_files = [f for f in os.listdir(self.source_dir) if f.endswith('.svg')]
+        if not source_files:
+            self.skipTest("No SVG files found in original_icons directory")
+        
+        process_folder(self.source_dir, os.path.join(self.output_dir, 'icons'), archive=True)
+        
+        archive_path = os.path.join(self.output_dir, 'icons.zip')
+        self.assertTrue(os.path.exists(archive_path))
+        with zipfile.ZipFile(archive_path) as archive:
+            self.assertEqual(set(source_files), set(archive.namelist()))
+            for filename in source_files:
+                with open(os.path.join(self.source_dir, filename), 'r', encoding='utf-8') as f:
+                    expected = add_dark_mode_attributes(f.read())
+                self.assertEqual(archive.read(filename).decode('utf-8'), expected)
+        
+        # Missing parent folders are created, and "." is named after the folder
+        process_folder(self.source_dir, os.path.join(self.output_dir, 'nope', 'out'), archive=True)
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, 'nope', 'out.zip')))
+        shutil.rmtree(os.path.join(self.output_dir, 'nope'))
+        
+        here = os.path.join(self.output_dir, 'here')
+        os.makedirs(here, exist_ok=True)
+        cwd = os.getcwd()
+        os.chdir(here)
+        try:
+            process_folder(self.source_dir, '.', archive=True)
+            self.assertFalse(os.path.exists('..zip'))
+        finally:
+            os.chdir(cwd)
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, 'here.zip')))
+        shutil.rmtree(here)
+
     def test_invalid_folder(self):
         """Test handling of invalid folder paths."""
         with self.assertRaises(ValueError):
@@ -157,5 +280,57 @@ class TestSVGDarkMode(unittest.TestCase):
         self.assertIn('fill="black" fill-dark="white"', result)
         self.assertIn('fill="white" fill-dark="black"', result)
 
+    def test_existing_dark_mode_attributes_replaced(self):
+        """Test that existing fill-dark/fill-light attributes are replaced."""
+        result = add_dark_mode_attributes('<path fill="black" fill-dark="red" fill-light="x"/>')
+        self.assertEqual(result.count('fill-dark='), 1)
+        self.assertIn('fill="black" fill-dark="white"', result)
+        self.assertNotIn('fill-light', result)
+
+    def test_shorthand_hex_color_conversion(self):
+        """Test handling of #RGB shorthand hex color values."""
+        result = add_dark_mode_attributes('<path fill="#fff"/><path fill="#0F8"/>')
+        self.assertIn('fill="#fff" fill-dark="#000000"', result)
+        self.assertIn('fill="#0F8" fill-dark="#ff0077"', result)
+        
+        # Alpha forms are inverted with the alpha dropped
+        result = add_dark_mode_attributes('<path fill="#fff8"/><path fill="#00000080"/>')
+        self.assertIn('fill="#fff8" fill-dark="#000000"', result)
+        self.assertIn('fill="#00000080" fill-dark="#ffffff"', result)
+
+    def test_invalid_hex_color(self):
+        """Test that malformed hex color values raise ValueError."""
+        for fill in ('#0x1234', '#ff_fff', '#  ffff', '#-fffff', '#12345', '#ggg'):
+            with self.subTest(fill=fill), self.assertRaises(ValueError):
+                add_dark_mode_attributes(f'<path fill="{fill}"/>')
+
+    def test_named_color_conversion(self):
+        """Test handling of CSS named colors."""
+        result = add_dark_mode_attributes('<path fill="blue"/><path fill="Red"/><path fill="none"/>')
+        self.assertIn('fill="blue" fill-dark="#ffff00"', result)
+        self.assertIn('fill="Red" fill-dark="#00ffff"', result)
+        self.assertIn('fill="none" fill-dark="none"', result)
+
+    @unittest.skipIf(svg_dark_mode.etree is None, "lxml is not installed")
+    def test_xml_mode(self):
+        """Test adding dark mode attributes via lxml."""
+        svg = '''<svg xmlns="http://www.w3.org/2000/svg">
+            <!-- <path fill="red"/> -->
+            <style>.existing{color:blue}</style>
+            <style>.a{fill:red}</style>
+            <path
+                fill="black" fill-dark="red" d="M0 0h24v24H0z"/>
+        </svg>'''
+        result = add_dark_mode_attributes_xml(svg)
+        self.assertIn('<!-- <path fill="red"/> -->', result)
+        self.assertIn('<style>.existing{color:blue}</style>', result)
+        self.assertNotIn('.a{fill:red}', result)
+        self.assertIn('fill="black" d="M0 0h24v24H0z" fill-dark="white"', result)
+        
+        with self.assertRaises(ValueError):
+            add_dark_mode_attributes_xml('<not-valid-svg>')
+        with self.assertRaises(ValueError):
+            add_dark_mode_attributes_xml('<style>.a{fill:red}</style>')
+
 if __name__ == '__main__':
     unittest.main()